@@ -0,0 +1,34 @@
+"""create tickets table
+
+Revision ID: 8f2c41d9a3b0
+Revises:
+Create Date: 2026-08-29
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "8f2c41d9a3b0"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tickets",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), nullable=True),
+    )
+    op.create_index("ix_tickets_id", "tickets", ["id"])
+    op.create_index("ix_tickets_title", "tickets", ["title"])
+    op.create_index("ix_tickets_status_id", "tickets", ["status", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tickets_status_id", table_name="tickets")
+    op.drop_index("ix_tickets_title", table_name="tickets")
+    op.drop_index("ix_tickets_id", table_name="tickets")
+    op.drop_table("tickets")
@@ -0,0 +1,42 @@
+"""store status as small int
+
+Revision ID: b7d05e12c4f8
+Revises: 8f2c41d9a3b0
+Create Date: 2026-08-29
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "b7d05e12c4f8"
+down_revision = "8f2c41d9a3b0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "UPDATE tickets SET status = CASE status"
+        " WHEN 'open' THEN 0 WHEN 'closed' THEN 1 ELSE 0 END"
+    )
+    with op.batch_alter_table("tickets") as batch_op:
+        batch_op.alter_column(
+            "status",
+            existing_type=sa.String(),
+            type_=sa.SmallInteger(),
+            nullable=False,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("tickets") as batch_op:
+        batch_op.alter_column(
+            "status",
+            existing_type=sa.SmallInteger(),
+            type_=sa.String(),
+            nullable=True,
+        )
+    op.execute(
+        "UPDATE tickets SET status = CASE status"
+        " WHEN 0 THEN 'open' WHEN 1 THEN 'closed' ELSE 'open' END"
+    )
@@ -5,7 +5,7 @@ from pydantic import Field
 
 
 class Settings(BaseSettings):
-    DATABASE_URL: str = Field(default="sqlite:///./tickets.db")
+    DATABASE_URL: str = Field(default="sqlite+aiosqlite:///./tickets.db")
     APP_NAME: str = "Smart API"
     APP_DESC: str = "A mini system with FastAPI"
     APP_VERSION: str = "1.0.0"
@@ -14,6 +14,16 @@ class Settings(BaseSettings):
     # CORS origins
     CORS_ORIGINS: str | None = None
 
+    # Connection pool tuning (ignored for SQLite)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 3600
+    DB_POOL_PRE_PING: bool = True
+
+    # SQL compilation cache (statements cached per engine)
+    DB_QUERY_CACHE_SIZE: int = 1200
+
     # Pydantic v2 style config
     model_config = SettingsConfigDict(
         env_file=".env",
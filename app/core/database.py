@@ -1,20 +1,57 @@
 # app/core/database.py
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import declarative_base
 from app.core.config import get_settings
 
 settings = get_settings()
 
-connect_args = {"check_same_thread": False} if settings.DATABASE_URL.startswith("sqlite") else {}
-engine = create_engine(settings.DATABASE_URL, connect_args=connect_args)
+is_sqlite = settings.DATABASE_URL.startswith("sqlite")
+connect_args = {"check_same_thread": False} if is_sqlite else {}
+# SQLite uses its own pooling; QueuePool sizing only applies to real servers.
+pool_kwargs = {} if is_sqlite else {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+    "pool_pre_ping": settings.DB_POOL_PRE_PING,
+}
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    connect_args=connect_args,
+    insertmanyvalues_page_size=1000,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    **pool_kwargs,
+)
+
+if is_sqlite:
+    # WAL lets readers proceed during writes; synchronous=NORMAL drops the
+    # per-commit fsync that WAL makes safe to skip.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA cache_size=-20000")
+        cursor.close()
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = async_sessionmaker(
+    bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
 Base = declarative_base()
 
-# Common DB dependency
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# One session per request, shared by everything under that request without
+# re-running FastAPI dependency resolution. The middleware in app.main sets
+# the scope key and removes the session when the response is done.
+request_scope: ContextVar[int] = ContextVar("request_scope", default=0)
+
+ScopedSession = async_scoped_session(SessionLocal, scopefunc=request_scope.get)
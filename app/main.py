@@ -1,13 +1,24 @@
 # app/main.py
+import sys
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import get_settings
-from app.core.database import Base, engine
+from app.core.database import ScopedSession, request_scope
 from app.ticket.routes import router as ticket_router
 
-Base.metadata.create_all(bind=engine)
+# uvloop is a drop-in asyncio replacement (not available on Windows)
+if sys.platform != "win32":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
 
+# Schema is managed by Alembic (`alembic upgrade head` at deploy time);
+# tests create tables via a fixture in tests/conftest.py.
 settings = get_settings()
 app = FastAPI(
     title=settings.APP_NAME,
@@ -20,25 +31,35 @@ origins = []
 if settings.CORS_ORIGINS:
     origins = [o.strip() for o in settings.CORS_ORIGINS.split(",")]
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+if origins:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=origins,
+        # Credentials + wildcard is rejected by browsers and forces the
+        # middleware to echo the Origin header on every request; with
+        # credentials off, "*" takes the static fast path.
+        allow_credentials="*" not in origins,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+@app.middleware("http")
+async def db_session_scope(request, call_next):
+    # Key the contextual session to this request; the contextvar propagates
+    # into the downstream task, so handlers and services share one session.
+    token = request_scope.set(id(request))
+    try:
+        return await call_next(request)
+    finally:
+        await ScopedSession.remove()
+        request_scope.reset(token)
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,        # or ["*"] to allow all
-    allow_credentials=True,
-    allow_methods=["*"],          # GET, POST, PUT, DELETE, OPTIONS...
-    allow_headers=["*"],
-)
 
 # Routers
 app.include_router(ticket_router)
 
+# Annotated return types let FastAPI serialize straight to JSON bytes via
+# pydantic-core, skipping jsonable_encoder + stdlib json entirely.
 @app.get("/health", tags=["Health"])
-def health():
+def health() -> dict[str, str]:
     return {"status": "ok"}
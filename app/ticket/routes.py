@@ -1,57 +1,131 @@
 # app/ticket/routes.py
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from app.core.database import get_db
-from app.ticket.schemas import TicketCreate, TicketOut, TicketUpdate
+from hashlib import md5
+
+from fastapi import APIRouter, Body, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from app.ticket.schemas import CREATE_BATCH, TICKET_OUT, TicketCreate, TicketOut, TicketUpdate
 from app.ticket import services as ticket_service
-from app.core.config import get_settings, Settings
+from app.core.config import get_settings
+
+# Settings are immutable after startup; binding once here skips FastAPI's
+# dependency-resolution machinery on every request.
+SETTINGS = get_settings()
+
 router = APIRouter(prefix="/tickets", tags=["Tickets"])
 
+# Short client/proxy cache window; If-None-Match revalidation below makes
+# repeat fetches of an unchanged ticket cost a header exchange, no body.
+CACHE_CONTROL = "max-age=5, stale-while-revalidate=30"
+
+
+def _ticket_etag(ticket) -> str:
+    # Hash the JSON payload itself: field boundaries stay unambiguous no
+    # matter what characters the title/description contain.
+    payload = TICKET_OUT.dump_json(TICKET_OUT.validate_python(ticket, from_attributes=True))
+    return f'"{md5(payload).hexdigest()}"'
+
 
 @router.get("/env")
-def env(settings: Settings = Depends(get_settings)):
+async def env() -> dict[str, str | None]:
     return {
         "message": "Hello from /test route!",
-        "secret_key": settings.ENV_,  # (don’t expose secrets in real apps)
+        "secret_key": SETTINGS.ENV_,  # (don’t expose secrets in real apps)
     }
 
 
 @router.post("/", response_model=TicketOut, status_code=201)
-def create(ticket: TicketCreate, db: Session = Depends(get_db)):
-    return ticket_service.create_ticket(db, ticket)
+async def create(ticket: TicketCreate):
+    return await ticket_service.create_ticket(ticket)
+
+
+@router.post(
+    "/bulk",
+    response_model=list[TicketOut],
+    status_code=201,
+    # The handler takes list[dict] so validation happens in one TypeAdapter
+    # pass; document the real contract so the bypass stays invisible.
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/TicketCreate"},
+                    }
+                }
+            },
+        }
+    },
+)
+async def create_bulk(tickets: list[dict] = Body(...)):
+    # Raw list in, one TypeAdapter pass over the whole batch — cheaper than
+    # FastAPI validating list[TicketCreate] element by element.
+    try:
+        items = CREATE_BATCH.validate_python(tickets)
+    except ValidationError as exc:
+        # Match the loc shape of FastAPI's own 422s: ["body", <index>, <field>]
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in exc.errors()]
+        )
+    return await ticket_service.create_tickets_bulk(items)
 
 
 @router.get("/", response_model=list[TicketOut])
-def list_all(
+async def list_all(
     status: str | None = Query(
         default=None, description="Filter by status: open or closed"),
-    db: Session = Depends(get_db),
+    limit: int = Query(default=50, ge=1, le=500, description="Page size"),
+    offset: int = Query(default=0, ge=0, description="Rows to skip"),
 ):
-    items = ticket_service.get_all_tickets(db)
-    if status:
-        items = [t for t in items if t.status == status]
-    return items
+    # Rows stream straight from the DB cursor into the JSON array: peak
+    # memory stays O(batch) and time-to-first-byte is constant in N.
+    async def body():
+        yield b"["
+        first = True
+        async for t in ticket_service.stream_all_tickets(status, limit, offset):
+            if not first:
+                yield b","
+            first = False
+            yield TICKET_OUT.dump_json(TICKET_OUT.validate_python(t, from_attributes=True))
+        yield b"]"
+
+    return StreamingResponse(
+        body(),
+        media_type="application/json",
+        headers={"Cache-Control": CACHE_CONTROL},
+    )
 
 
 @router.get("/{ticket_id}", response_model=TicketOut)
-def get(ticket_id: int, db: Session = Depends(get_db)):
-    ticket = ticket_service.get_ticket(db, ticket_id)
+async def get(ticket_id: int, request: Request, response: Response):
+    ticket = await ticket_service.get_ticket(ticket_id)
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
+    etag = _ticket_etag(ticket)
+    if request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=304,
+            headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+        )
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
     return ticket
 
 
 @router.put("/{ticket_id}", response_model=TicketOut)
-def update(ticket_id: int, ticket: TicketUpdate, db: Session = Depends(get_db)):
-    updated = ticket_service.update_ticket(db, ticket_id, ticket)
+async def update(ticket_id: int, ticket: TicketUpdate):
+    updated = await ticket_service.update_ticket(ticket_id, ticket)
     if not updated:
         raise HTTPException(status_code=404, detail="Ticket not found")
     return updated
 
 
 @router.delete("/{ticket_id}", response_model=TicketOut)
-def delete(ticket_id: int, db: Session = Depends(get_db)):
-    deleted = ticket_service.delete_ticket(db, ticket_id)
+async def delete(ticket_id: int):
+    deleted = await ticket_service.delete_ticket(ticket_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Ticket not found")
     return deleted
@@ -1,5 +1,7 @@
 # app/ticket/schemas.py
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+
+from app.ticket.models import TicketStatus
 
 class TicketBase(BaseModel):
     title: str = Field(..., min_length=1)
@@ -11,10 +13,37 @@ class TicketCreate(TicketBase):
 class TicketUpdate(BaseModel):
     title: str | None = None
     description: str | None = None
-    status: str | None = None
+    status: TicketStatus | None = None
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def parse_status(cls, v):
+        # API clients send "open"/"closed"; the column stores the int.
+        if isinstance(v, str):
+            try:
+                return TicketStatus[v.upper()]
+            except KeyError:
+                raise ValueError("status must be 'open' or 'closed'")
+        return v
 
 class TicketOut(TicketBase):
     id: int
     status: str
 
     model_config = {"from_attributes": True}
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def status_name(cls, v):
+        if isinstance(v, int):
+            return TicketStatus(v).name.lower()
+        return v
+
+
+# Compiled once at import; validating/dumping rows through this is much
+# cheaper than FastAPI's per-object model_validate in the response path.
+TICKET_OUT = TypeAdapter(TicketOut)
+
+# Same idea on the input side: one pydantic-core call validates a whole
+# bulk-create payload instead of N per-element entries.
+CREATE_BATCH = TypeAdapter(list[TicketCreate])
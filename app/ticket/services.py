@@ -1,35 +1,85 @@
 # app/ticket/services.py
-from sqlalchemy.orm import Session
-from app.ticket.models import Ticket
+from cachetools import TTLCache
+from sqlalchemy import delete, insert, select, update
+from collections.abc import AsyncIterator
+
+from app.core.database import ScopedSession, SessionLocal
+from app.ticket.models import Ticket, TicketStatus
 from app.ticket.schemas import TicketCreate, TicketUpdate
 
-def get_all_tickets(db: Session) -> list[Ticket]:
-    return db.query(Ticket).all()
+# Per-process read cache for hot tickets; writes invalidate their key below.
+# Single-worker only — promote to Redis if the app runs multiple workers.
+_ticket_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+async def stream_all_tickets(
+    status: str | None = None,
+    limit: int = 50,
+    offset: int = 0,
+) -> AsyncIterator[Ticket]:
+    # Owns its session rather than using the request-scoped one: the response
+    # body is consumed after the middleware has already torn that scope down.
+    async with SessionLocal() as db:
+        q = select(Ticket)
+        if status:
+            try:
+                q = q.where(Ticket.status == TicketStatus[status.upper()])
+            except KeyError:
+                return
+        q = q.order_by(Ticket.id).limit(limit).offset(offset)
+        result = await db.stream(q.execution_options(yield_per=500))
+        async for ticket in result.scalars():
+            yield ticket
 
-def get_ticket(db: Session, ticket_id: int) -> Ticket | None:
-    return db.query(Ticket).filter(Ticket.id == ticket_id).first()
+async def get_ticket(ticket_id: int) -> Ticket | None:
+    cached = _ticket_cache.get(ticket_id)
+    if cached is not None:
+        return cached
+    ticket = await ScopedSession().get(Ticket, ticket_id)
+    if ticket is not None:
+        _ticket_cache[ticket_id] = ticket
+    return ticket
 
-def create_ticket(db: Session, payload: TicketCreate) -> Ticket:
+async def create_ticket(payload: TicketCreate) -> Ticket:
+    db = ScopedSession()
     db_ticket = Ticket(**payload.model_dump())
     db.add(db_ticket)
-    db.commit()
-    db.refresh(db_ticket)
+    await db.commit()
+    await db.refresh(db_ticket)
     return db_ticket
 
-def update_ticket(db: Session, ticket_id: int, payload: TicketUpdate) -> Ticket | None:
-    db_ticket = get_ticket(db, ticket_id)
-    if not db_ticket:
-        return None
-    for field, value in payload.model_dump(exclude_unset=True).items():
-        setattr(db_ticket, field, value)
-    db.commit()
-    db.refresh(db_ticket)
+async def create_tickets_bulk(payloads: list[TicketCreate]) -> list[Ticket]:
+    # An empty params list would make execute() run the statement once with
+    # no parameters, i.e. try to insert an all-NULL row.
+    if not payloads:
+        return []
+    db = ScopedSession()
+    result = await db.execute(
+        insert(Ticket).returning(Ticket),
+        [p.model_dump() for p in payloads],
+    )
+    tickets = list(result.scalars().all())
+    await db.commit()
+    return tickets
+
+async def update_ticket(ticket_id: int, payload: TicketUpdate) -> Ticket | None:
+    values = payload.model_dump(exclude_unset=True)
+    if not values:
+        return await get_ticket(ticket_id)
+    db = ScopedSession()
+    result = await db.execute(
+        update(Ticket).where(Ticket.id == ticket_id).values(**values).returning(Ticket)
+    )
+    db_ticket = result.scalars().first()
+    await db.commit()
+    _ticket_cache.pop(ticket_id, None)
     return db_ticket
 
-def delete_ticket(db: Session, ticket_id: int) -> Ticket | None:
-    db_ticket = get_ticket(db, ticket_id)
-    if not db_ticket:
-        return None
-    db.delete(db_ticket)
-    db.commit()
+async def delete_ticket(ticket_id: int) -> Ticket | None:
+    db = ScopedSession()
+    result = await db.execute(
+        delete(Ticket).where(Ticket.id == ticket_id).returning(Ticket)
+    )
+    db_ticket = result.scalars().first()
+    await db.commit()
+    _ticket_cache.pop(ticket_id, None)
     return db_ticket
@@ -1,3 +1,48 @@
 # tests/conftest.py
+import asyncio
 import os, sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Point the app at a throwaway database before app.core.config is imported
+# (get_settings is cached), so the suite never touches tickets.db.
+TEST_DB = "test_tickets.db"
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///./{TEST_DB}"
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.database import Base, engine
+from app.main import app
+
+
+def _remove_test_db():
+    for suffix in ("", "-shm", "-wal"):
+        try:
+            os.remove(TEST_DB + suffix)
+        except FileNotFoundError:
+            pass
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_tables():
+    # The app no longer creates tables at startup (Alembic owns the schema);
+    # tests build them here once. Dispose so connections don't leak across
+    # event loops into the TestClient's loop.
+    _remove_test_db()
+
+    async def _create():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        await engine.dispose()
+
+    asyncio.run(_create())
+    yield
+    _remove_test_db()
+
+
+@pytest.fixture(scope="session")
+def client(create_tables):
+    # One client (and one ASGI lifespan) for the whole session; requests
+    # reuse the same transport instead of rebuilding it per test.
+    with TestClient(app) as c:
+        yield c
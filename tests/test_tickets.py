@@ -1,17 +1,13 @@
 # tests/test_tickets.py
-from fastapi.testclient import TestClient
-from app.main import app
 
-client = TestClient(app)
 
-
-def test_health():
+def test_health(client):
     r = client.get("/health")
     assert r.status_code == 200
     assert r.json()["status"] == "ok"
 
 
-def test_create_and_get_ticket():
+def test_create_and_get_ticket(client):
     r = client.post("/tickets", json={"title": "T1", "description": "D1"})
     assert r.status_code == 201
     tid = r.json()["id"]
@@ -24,13 +20,32 @@ def test_create_and_get_ticket():
     assert data["status"] == "open"
 
 
-def test_list_returns_array():
+def test_create_bulk_tickets(client):
+    payload = [
+        {"title": "Bulk 1", "description": "D1"},
+        {"title": "Bulk 2", "description": "D2"},
+    ]
+    r = client.post("/tickets/bulk", json=payload)
+    assert r.status_code == 201
+    data = r.json()
+    assert len(data) == 2
+    assert {t["title"] for t in data} == {"Bulk 1", "Bulk 2"}
+    assert all(t["status"] == "open" for t in data)
+
+
+def test_create_bulk_empty_list(client):
+    r = client.post("/tickets/bulk", json=[])
+    assert r.status_code == 201
+    assert r.json() == []
+
+
+def test_list_returns_array(client):
     r = client.get("/tickets")
     assert r.status_code == 200
     assert isinstance(r.json(), list)
 
 
-def test_update_ticket_title_and_status():
+def test_update_ticket_title_and_status(client):
     # create
     r = client.post("/tickets", json={"title": "To Update", "description": "Body"})
     assert r.status_code == 201
@@ -50,7 +65,7 @@ def test_update_ticket_title_and_status():
     assert r3.json()["status"] == "closed"
 
 
-def test_delete_ticket_then_404():
+def test_delete_ticket_then_404(client):
     # create
     r = client.post("/tickets", json={"title": "To Delete", "description": "D"})
     assert r.status_code == 201
@@ -67,14 +82,35 @@ def test_delete_ticket_then_404():
     assert r3.json()["detail"] == "Ticket not found"
 
 
-def test_get_not_found_returns_404():
+def test_get_ticket_etag_revalidation(client):
+    r = client.post("/tickets", json={"title": "Cached", "description": "D"})
+    assert r.status_code == 201
+    tid = r.json()["id"]
+
+    r2 = client.get(f"/tickets/{tid}")
+    assert r2.status_code == 200
+    etag = r2.headers["etag"]
+
+    # unchanged ticket revalidates to an empty 304
+    r3 = client.get(f"/tickets/{tid}", headers={"If-None-Match": etag})
+    assert r3.status_code == 304
+    assert r3.content == b""
+
+    # a change produces a new ETag so the old one misses
+    client.put(f"/tickets/{tid}", json={"status": "closed"})
+    r4 = client.get(f"/tickets/{tid}", headers={"If-None-Match": etag})
+    assert r4.status_code == 200
+    assert r4.headers["etag"] != etag
+
+
+def test_get_not_found_returns_404(client):
     # very large id that likely doesn't exist
     r = client.get("/tickets/9999999")
     assert r.status_code == 404
     assert r.json()["detail"] == "Ticket not found"
 
 
-def test_create_validation_errors():
+def test_create_validation_errors(client):
     # missing title
     r1 = client.post("/tickets", json={"description": "no title"})
     assert r1.status_code == 422
@@ -88,7 +124,7 @@ def test_create_validation_errors():
     assert r3.status_code == 422
 
 
-def test_filter_by_status_open_only():
+def test_filter_by_status_open_only(client):
     # create two tickets
     a = client.post("/tickets", json={"title": "A", "description": "A"}).json()
     b = client.post("/tickets", json={"title": "B", "description": "B"}).json()
@@ -96,8 +132,8 @@ def test_filter_by_status_open_only():
     # close one of them
     client.put(f"/tickets/{b['id']}", json={"status": "closed"})
 
-    # fetch only open
-    r = client.get("/tickets?status=open")
+    # fetch only open (max page size so earlier test data doesn't push ours out)
+    r = client.get("/tickets?status=open&limit=500")
     assert r.status_code == 200
     ids = {t["id"] for t in r.json()}
     # 'a' should be present, 'b' should not